@@ -8,13 +8,37 @@ CDC, FDA, and state legislative sources.
 Last Updated: December 2024/January 2025
 """
 
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field, fields
 from typing import Optional, List, Dict
-import json
 from datetime import date
-
-
-@dataclass
+from itertools import compress
+from operator import attrgetter
+from types import MappingProxyType
+from sys import intern
+
+
+# Shared values for the repeated categorical fields, interned so every row
+# references the same string object
+BAN_NONE = intern("none")
+BAN_PARTIAL = intern("partial")
+BAN_COMPREHENSIVE = intern("comprehensive")
+
+TAX_WHOLESALE_PCT = intern("wholesale %")
+TAX_RETAIL_PCT = intern("retail %")
+TAX_MANUFACTURER_PCT = intern("manufacturer %")
+TAX_PER_ML = intern("per mL")
+TAX_PER_CARTRIDGE = intern("per cartridge")
+TAX_HYBRID = intern("hybrid")
+
+SRC_TAX_FOUNDATION_2025 = intern("Tax Foundation 2025")
+SRC_TRUTH_INITIATIVE_2025 = intern("Truth Initiative 2025")
+SRC_VAPERANGER_2025 = intern("VapeRanger 2025")
+SRC_CTFK_2024 = intern("Campaign for Tobacco-Free Kids 2024")
+SRC_ECIGATOR_2025 = intern("Ecigator 2025")
+SRC_COMPLYIQ_2025 = intern("ComplyIQ 2025")
+
+
+@dataclass(slots=True, frozen=True)
 class StateTobaccoPolicy:
     """Comprehensive tobacco and vaping policy data for a state"""
 
@@ -34,7 +58,7 @@ class StateTobaccoPolicy:
     # Taxation
     has_ecig_tax: bool = False
     ecig_tax_rate: str = ""
-    ecig_tax_structure: str = ""  # "wholesale %", "per mL", "retail %", "per cartridge"
+    ecig_tax_structure: str = ""  # "wholesale %", "per mL", "retail %", "per cartridge", "manufacturer %", "hybrid"
 
     # Indoor restrictions
     indoor_vaping_ban: bool = False
@@ -59,7 +83,16 @@ class StateTobaccoPolicy:
 
     def to_dict(self) -> Dict:
         """Convert to dictionary for JSON export"""
-        return asdict(self)
+        # No nested dataclasses, so a shallow copy (plus fresh lists) avoids
+        # the recursive deepcopy done by dataclasses.asdict
+        data = {name: getattr(self, name) for name in _FIELDS}
+        data["local_restrictions"] = list(self.local_restrictions)
+        data["sources"] = list(self.sources)
+        return data
+
+
+# Field names in declaration order, computed once for to_dict
+_FIELDS = tuple(f.name for f in fields(StateTobaccoPolicy))
 
 
 # State policy database
@@ -67,52 +100,52 @@ STATES = [
     StateTobaccoPolicy(
         state="Alabama",
         state_abbr="AL",
-        flavored_ecig_ban="none",
+        flavored_ecig_ban=BAN_NONE,
         flavored_ecig_details="No statewide restrictions on flavored e-cigarettes",
         has_ecig_tax=False,
         indoor_vaping_ban=False,
         state_t21_law=False,
-        sources=["Tax Foundation 2025", "Truth Initiative 2025"]
+        sources=[SRC_TAX_FOUNDATION_2025, SRC_TRUTH_INITIATIVE_2025]
     ),
 
     StateTobaccoPolicy(
         state="Alaska",
         state_abbr="AK",
-        flavored_ecig_ban="none",
+        flavored_ecig_ban=BAN_NONE,
         flavored_ecig_details="No statewide restrictions on flavored e-cigarettes",
         has_ecig_tax=False,
         ecig_tax_rate="No statewide tax, but several municipalities impose taxes: Juneau (45%), Anchorage (55%), Matanuska-Susitna (55%)",
         indoor_vaping_ban=False,
         state_t21_law=True,
-        sources=["Tax Foundation 2025", "ComplyIQ 2025"]
+        sources=[SRC_TAX_FOUNDATION_2025, SRC_COMPLYIQ_2025]
     ),
 
     StateTobaccoPolicy(
         state="Arizona",
         state_abbr="AZ",
-        flavored_ecig_ban="none",
+        flavored_ecig_ban=BAN_NONE,
         flavored_ecig_details="No statewide restrictions on flavored e-cigarettes",
         has_ecig_tax=False,
         indoor_vaping_ban=False,
         state_t21_law=True,
-        sources=["Tax Foundation 2025", "Truth Initiative 2025"]
+        sources=[SRC_TAX_FOUNDATION_2025, SRC_TRUTH_INITIATIVE_2025]
     ),
 
     StateTobaccoPolicy(
         state="Arkansas",
         state_abbr="AR",
-        flavored_ecig_ban="none",
+        flavored_ecig_ban=BAN_NONE,
         flavored_ecig_details="No statewide restrictions on flavored e-cigarettes",
         has_ecig_tax=False,
         indoor_vaping_ban=False,
         state_t21_law=True,
-        sources=["Tax Foundation 2025"]
+        sources=[SRC_TAX_FOUNDATION_2025]
     ),
 
     StateTobaccoPolicy(
         state="California",
         state_abbr="CA",
-        flavored_ecig_ban="comprehensive",
+        flavored_ecig_ban=BAN_COMPREHENSIVE,
         flavored_ecig_details="Comprehensive ban on all flavored tobacco products including menthol. Voters upheld the ban in November 2022.",
         flavored_ecig_effective_date="2022-12-21",
         menthol_cig_ban=True,
@@ -120,222 +153,222 @@ STATES = [
         menthol_effective_date="2022-12-21",
         has_ecig_tax=True,
         ecig_tax_rate="12.5% wholesale, rising to 56.67% by July 1, 2026",
-        ecig_tax_structure="wholesale %",
+        ecig_tax_structure=TAX_WHOLESALE_PCT,
         indoor_vaping_ban=True,
         indoor_ban_details="Comprehensive smoke-free law covering e-cigarettes in workplaces, restaurants, and bars",
         state_t21_law=True,
         recent_changes="As of Jan 1, 2025, flavor prohibition extended to internet sales. AB 3218 prohibits menthol-like cooling sensations (WS-3, WS-23). SB 1230 allows seizure of illegal flavored products.",
         local_restrictions=["Numerous cities and counties with additional restrictions"],
-        sources=["Campaign for Tobacco-Free Kids 2024", "VapeRanger 2025", "Truth Initiative 2025"]
+        sources=[SRC_CTFK_2024, SRC_VAPERANGER_2025, SRC_TRUTH_INITIATIVE_2025]
     ),
 
     StateTobaccoPolicy(
         state="Colorado",
         state_abbr="CO",
-        flavored_ecig_ban="partial",
+        flavored_ecig_ban=BAN_PARTIAL,
         flavored_ecig_details="State law bans flavored vape products except tobacco and menthol flavors",
         has_ecig_tax=True,
         ecig_tax_rate="30% wholesale (open), 50% wholesale (closed)",
-        ecig_tax_structure="wholesale %",
+        ecig_tax_structure=TAX_WHOLESALE_PCT,
         indoor_vaping_ban=True,
         indoor_ban_details="Comprehensive smoke-free law covering e-cigarettes",
         state_t21_law=True,
-        sources=["Tax Foundation 2025", "VapeRanger 2025"]
+        sources=[SRC_TAX_FOUNDATION_2025, SRC_VAPERANGER_2025]
     ),
 
     StateTobaccoPolicy(
         state="Connecticut",
         state_abbr="CT",
-        flavored_ecig_ban="none",
+        flavored_ecig_ban=BAN_NONE,
         flavored_ecig_details="No statewide flavor ban",
         has_ecig_tax=True,
         ecig_tax_rate="$0.40 per mL",
-        ecig_tax_structure="per mL",
+        ecig_tax_structure=TAX_PER_ML,
         indoor_vaping_ban=True,
         indoor_ban_details="Comprehensive smoke-free law covering e-cigarettes",
         state_t21_law=True,
-        sources=["Tax Foundation 2025", "Truth Initiative 2025"]
+        sources=[SRC_TAX_FOUNDATION_2025, SRC_TRUTH_INITIATIVE_2025]
     ),
 
     StateTobaccoPolicy(
         state="Delaware",
         state_abbr="DE",
-        flavored_ecig_ban="partial",
+        flavored_ecig_ban=BAN_PARTIAL,
         flavored_ecig_details="Illegal to sell flavored single-use disposable vapes",
         has_ecig_tax=True,
         ecig_tax_rate="$1.25 per mL",
-        ecig_tax_structure="per mL",
+        ecig_tax_structure=TAX_PER_ML,
         indoor_vaping_ban=True,
         indoor_ban_details="Comprehensive smoke-free law covering e-cigarettes",
         licensing_required=True,
         license_fee="$800/year",
         state_t21_law=True,
-        sources=["Tax Foundation 2025", "Ecigator 2025", "Truth Initiative 2025"]
+        sources=[SRC_TAX_FOUNDATION_2025, SRC_ECIGATOR_2025, SRC_TRUTH_INITIATIVE_2025]
     ),
 
     StateTobaccoPolicy(
         state="Florida",
         state_abbr="FL",
-        flavored_ecig_ban="none",
+        flavored_ecig_ban=BAN_NONE,
         flavored_ecig_details="No statewide restrictions on flavored e-cigarettes",
         has_ecig_tax=False,
         indoor_vaping_ban=False,
         state_t21_law=False,
-        sources=["Tax Foundation 2025"]
+        sources=[SRC_TAX_FOUNDATION_2025]
     ),
 
     StateTobaccoPolicy(
         state="Georgia",
         state_abbr="GA",
-        flavored_ecig_ban="none",
+        flavored_ecig_ban=BAN_NONE,
         flavored_ecig_details="No statewide restrictions on flavored e-cigarettes",
         has_ecig_tax=True,
         ecig_tax_rate="7% wholesale",
-        ecig_tax_structure="wholesale %",
+        ecig_tax_structure=TAX_WHOLESALE_PCT,
         indoor_vaping_ban=False,
         state_t21_law=True,
-        sources=["Tax Foundation 2025"]
+        sources=[SRC_TAX_FOUNDATION_2025]
     ),
 
     StateTobaccoPolicy(
         state="Hawaii",
         state_abbr="HI",
-        flavored_ecig_ban="none",
+        flavored_ecig_ban=BAN_NONE,
         flavored_ecig_details="No statewide flavor ban",
         has_ecig_tax=True,
         ecig_tax_rate="70% wholesale",
-        ecig_tax_structure="wholesale %",
+        ecig_tax_structure=TAX_WHOLESALE_PCT,
         indoor_vaping_ban=True,
         indoor_ban_details="Comprehensive smoke-free law covering e-cigarettes",
         state_t21_law=True,
-        sources=["Tax Foundation 2025", "Truth Initiative 2025"]
+        sources=[SRC_TAX_FOUNDATION_2025, SRC_TRUTH_INITIATIVE_2025]
     ),
 
     StateTobaccoPolicy(
         state="Idaho",
         state_abbr="ID",
-        flavored_ecig_ban="none",
+        flavored_ecig_ban=BAN_NONE,
         flavored_ecig_details="No statewide restrictions on flavored e-cigarettes",
         has_ecig_tax=False,
         indoor_vaping_ban=False,
         state_t21_law=False,
-        sources=["Tax Foundation 2025"]
+        sources=[SRC_TAX_FOUNDATION_2025]
     ),
 
     StateTobaccoPolicy(
         state="Illinois",
         state_abbr="IL",
-        flavored_ecig_ban="none",
+        flavored_ecig_ban=BAN_NONE,
         flavored_ecig_details="No statewide flavor ban, but many local restrictions",
         has_ecig_tax=True,
         ecig_tax_rate="$2.50 per mL",
-        ecig_tax_structure="per mL",
+        ecig_tax_structure=TAX_PER_ML,
         indoor_vaping_ban=True,
         indoor_ban_details="Comprehensive smoke-free law covering e-cigarettes",
         licensing_required=True,
         license_fee="$1,200/year",
         state_t21_law=True,
         local_restrictions=["Chicago has comprehensive local flavor restrictions"],
-        sources=["Tax Foundation 2025", "Ecigator 2025", "Truth Initiative 2025"]
+        sources=[SRC_TAX_FOUNDATION_2025, SRC_ECIGATOR_2025, SRC_TRUTH_INITIATIVE_2025]
     ),
 
     StateTobaccoPolicy(
         state="Indiana",
         state_abbr="IN",
-        flavored_ecig_ban="none",
+        flavored_ecig_ban=BAN_NONE,
         flavored_ecig_details="No statewide restrictions on flavored e-cigarettes",
         has_ecig_tax=True,
         ecig_tax_rate="15% wholesale",
-        ecig_tax_structure="wholesale %",
+        ecig_tax_structure=TAX_WHOLESALE_PCT,
         indoor_vaping_ban=False,
         state_t21_law=True,
-        sources=["Tax Foundation 2025"]
+        sources=[SRC_TAX_FOUNDATION_2025]
     ),
 
     StateTobaccoPolicy(
         state="Iowa",
         state_abbr="IA",
-        flavored_ecig_ban="none",
+        flavored_ecig_ban=BAN_NONE,
         flavored_ecig_details="No statewide restrictions on flavored e-cigarettes",
         has_ecig_tax=False,
         ecig_tax_rate="Subject to sales tax only",
         indoor_vaping_ban=False,
         state_t21_law=False,
-        sources=["Tax Foundation 2025", "ComplyIQ 2025"]
+        sources=[SRC_TAX_FOUNDATION_2025, SRC_COMPLYIQ_2025]
     ),
 
     StateTobaccoPolicy(
         state="Kansas",
         state_abbr="KS",
-        flavored_ecig_ban="none",
+        flavored_ecig_ban=BAN_NONE,
         flavored_ecig_details="No statewide restrictions on flavored e-cigarettes",
         has_ecig_tax=True,
         ecig_tax_rate="20% retail",
-        ecig_tax_structure="retail %",
+        ecig_tax_structure=TAX_RETAIL_PCT,
         indoor_vaping_ban=True,
         indoor_ban_details="Comprehensive smoke-free law covering e-cigarettes",
         state_t21_law=True,
-        sources=["Tax Foundation 2025", "Truth Initiative 2025"]
+        sources=[SRC_TAX_FOUNDATION_2025, SRC_TRUTH_INITIATIVE_2025]
     ),
 
     StateTobaccoPolicy(
         state="Kentucky",
         state_abbr="KY",
-        flavored_ecig_ban="none",
+        flavored_ecig_ban=BAN_NONE,
         flavored_ecig_details="No statewide restrictions on flavored e-cigarettes",
         has_ecig_tax=True,
         ecig_tax_rate="$1.50 per cartridge",
-        ecig_tax_structure="per cartridge",
+        ecig_tax_structure=TAX_PER_CARTRIDGE,
         indoor_vaping_ban=False,
         state_t21_law=True,
-        sources=["Tax Foundation 2025"]
+        sources=[SRC_TAX_FOUNDATION_2025]
     ),
 
     StateTobaccoPolicy(
         state="Louisiana",
         state_abbr="LA",
-        flavored_ecig_ban="none",
+        flavored_ecig_ban=BAN_NONE,
         flavored_ecig_details="No statewide restrictions on flavored e-cigarettes",
         has_ecig_tax=True,
         ecig_tax_rate="15% wholesale",
-        ecig_tax_structure="wholesale %",
+        ecig_tax_structure=TAX_WHOLESALE_PCT,
         indoor_vaping_ban=False,
         state_t21_law=True,
-        sources=["Tax Foundation 2025"]
+        sources=[SRC_TAX_FOUNDATION_2025]
     ),
 
     StateTobaccoPolicy(
         state="Maine",
         state_abbr="ME",
-        flavored_ecig_ban="none",
+        flavored_ecig_ban=BAN_NONE,
         flavored_ecig_details="No statewide flavor ban",
         has_ecig_tax=True,
         ecig_tax_rate="43% wholesale",
-        ecig_tax_structure="wholesale %",
+        ecig_tax_structure=TAX_WHOLESALE_PCT,
         indoor_vaping_ban=True,
         indoor_ban_details="Comprehensive smoke-free law covering e-cigarettes",
         state_t21_law=True,
-        sources=["Tax Foundation 2025", "Truth Initiative 2025"]
+        sources=[SRC_TAX_FOUNDATION_2025, SRC_TRUTH_INITIATIVE_2025]
     ),
 
     StateTobaccoPolicy(
         state="Maryland",
         state_abbr="MD",
-        flavored_ecig_ban="partial",
+        flavored_ecig_ban=BAN_PARTIAL,
         flavored_ecig_details="Limits flavored product sales to age-restricted venues",
         has_ecig_tax=True,
         ecig_tax_rate="60% retail",
-        ecig_tax_structure="retail %",
+        ecig_tax_structure=TAX_RETAIL_PCT,
         indoor_vaping_ban=True,
         indoor_ban_details="Comprehensive smoke-free law covering e-cigarettes",
         state_t21_law=True,
-        sources=["Tax Foundation 2025", "Ecigator 2025", "Truth Initiative 2025"]
+        sources=[SRC_TAX_FOUNDATION_2025, SRC_ECIGATOR_2025, SRC_TRUTH_INITIATIVE_2025]
     ),
 
     StateTobaccoPolicy(
         state="Massachusetts",
         state_abbr="MA",
-        flavored_ecig_ban="comprehensive",
+        flavored_ecig_ban=BAN_COMPREHENSIVE,
         flavored_ecig_details="First state to ban all flavored tobacco products including menthol cigarettes (effective 2020)",
         flavored_ecig_effective_date="2020-06-01",
         menthol_cig_ban=True,
@@ -343,418 +376,473 @@ STATES = [
         menthol_effective_date="2020-06-01",
         has_ecig_tax=True,
         ecig_tax_rate="75% wholesale",
-        ecig_tax_structure="wholesale %",
+        ecig_tax_structure=TAX_WHOLESALE_PCT,
         indoor_vaping_ban=True,
         indoor_ban_details="Comprehensive smoke-free law covering e-cigarettes",
         state_t21_law=True,
-        sources=["Campaign for Tobacco-Free Kids 2024", "Tax Foundation 2025", "Stateline 2024"]
+        sources=[SRC_CTFK_2024, SRC_TAX_FOUNDATION_2025, "Stateline 2024"]
     ),
 
     StateTobaccoPolicy(
         state="Michigan",
         state_abbr="MI",
-        flavored_ecig_ban="none",
+        flavored_ecig_ban=BAN_NONE,
         flavored_ecig_details="No statewide restrictions on flavored e-cigarettes",
         has_ecig_tax=False,
         indoor_vaping_ban=False,
         state_t21_law=True,
-        sources=["Tax Foundation 2025"]
+        sources=[SRC_TAX_FOUNDATION_2025]
     ),
 
     StateTobaccoPolicy(
         state="Minnesota",
         state_abbr="MN",
-        flavored_ecig_ban="none",
+        flavored_ecig_ban=BAN_NONE,
         flavored_ecig_details="No statewide flavor ban",
         has_ecig_tax=True,
         ecig_tax_rate="95% wholesale",
-        ecig_tax_structure="wholesale %",
+        ecig_tax_structure=TAX_WHOLESALE_PCT,
         indoor_vaping_ban=False,
         state_t21_law=True,
-        sources=["Tax Foundation 2025"]
+        sources=[SRC_TAX_FOUNDATION_2025]
     ),
 
     StateTobaccoPolicy(
         state="Mississippi",
         state_abbr="MS",
-        flavored_ecig_ban="none",
+        flavored_ecig_ban=BAN_NONE,
         flavored_ecig_details="No statewide restrictions on flavored e-cigarettes",
         has_ecig_tax=False,
         indoor_vaping_ban=False,
         state_t21_law=False,
-        sources=["Tax Foundation 2025"]
+        sources=[SRC_TAX_FOUNDATION_2025]
     ),
 
     StateTobaccoPolicy(
         state="Missouri",
         state_abbr="MO",
-        flavored_ecig_ban="none",
+        flavored_ecig_ban=BAN_NONE,
         flavored_ecig_details="No statewide restrictions on flavored e-cigarettes",
         has_ecig_tax=False,
         indoor_vaping_ban=False,
         state_t21_law=False,
-        sources=["Tax Foundation 2025"]
+        sources=[SRC_TAX_FOUNDATION_2025]
     ),
 
     StateTobaccoPolicy(
         state="Montana",
         state_abbr="MT",
-        flavored_ecig_ban="none",
+        flavored_ecig_ban=BAN_NONE,
         flavored_ecig_details="No statewide restrictions on flavored e-cigarettes",
         has_ecig_tax=False,
         indoor_vaping_ban=False,
         state_t21_law=False,
-        sources=["Tax Foundation 2025"]
+        sources=[SRC_TAX_FOUNDATION_2025]
     ),
 
     StateTobaccoPolicy(
         state="Nebraska",
         state_abbr="NE",
-        flavored_ecig_ban="none",
+        flavored_ecig_ban=BAN_NONE,
         flavored_ecig_details="No statewide restrictions on flavored e-cigarettes",
         has_ecig_tax=True,
         ecig_tax_rate="20% wholesale",
-        ecig_tax_structure="wholesale %",
+        ecig_tax_structure=TAX_WHOLESALE_PCT,
         indoor_vaping_ban=False,
         state_t21_law=True,
-        sources=["Tax Foundation 2025"]
+        sources=[SRC_TAX_FOUNDATION_2025]
     ),
 
     StateTobaccoPolicy(
         state="Nevada",
         state_abbr="NV",
-        flavored_ecig_ban="none",
+        flavored_ecig_ban=BAN_NONE,
         flavored_ecig_details="No statewide restrictions on flavored e-cigarettes",
         has_ecig_tax=True,
         ecig_tax_rate="30% wholesale",
-        ecig_tax_structure="wholesale %",
+        ecig_tax_structure=TAX_WHOLESALE_PCT,
         indoor_vaping_ban=False,
         state_t21_law=True,
-        sources=["Tax Foundation 2025"]
+        sources=[SRC_TAX_FOUNDATION_2025]
     ),
 
     StateTobaccoPolicy(
         state="New Hampshire",
         state_abbr="NH",
-        flavored_ecig_ban="none",
+        flavored_ecig_ban=BAN_NONE,
         flavored_ecig_details="No statewide restrictions on flavored e-cigarettes",
         has_ecig_tax=True,
         ecig_tax_rate="8% wholesale (open), $0.30/mL (closed)",
-        ecig_tax_structure="hybrid",
+        ecig_tax_structure=TAX_HYBRID,
         indoor_vaping_ban=False,
         state_t21_law=True,
-        sources=["Tax Foundation 2025"]
+        sources=[SRC_TAX_FOUNDATION_2025]
     ),
 
     StateTobaccoPolicy(
         state="New Jersey",
         state_abbr="NJ",
-        flavored_ecig_ban="comprehensive",
+        flavored_ecig_ban=BAN_COMPREHENSIVE,
         flavored_ecig_details="Comprehensive ban on flavored e-cigarettes (tobacco flavor only allowed). Does NOT ban menthol cigarettes.",
         flavored_ecig_effective_date="2020-04-20",
         menthol_cig_ban=False,
         has_ecig_tax=True,
         ecig_tax_rate="10% retail",
-        ecig_tax_structure="retail %",
+        ecig_tax_structure=TAX_RETAIL_PCT,
         indoor_vaping_ban=True,
         indoor_ban_details="Comprehensive smoke-free law covering e-cigarettes",
         state_t21_law=True,
-        sources=["Campaign for Tobacco-Free Kids 2024", "Tax Foundation 2025", "VapeRanger 2025"]
+        sources=[SRC_CTFK_2024, SRC_TAX_FOUNDATION_2025, SRC_VAPERANGER_2025]
     ),
 
     StateTobaccoPolicy(
         state="New Mexico",
         state_abbr="NM",
-        flavored_ecig_ban="none",
+        flavored_ecig_ban=BAN_NONE,
         flavored_ecig_details="No statewide restrictions on flavored e-cigarettes",
         has_ecig_tax=True,
         ecig_tax_rate="$0.50 per cartridge",
-        ecig_tax_structure="per cartridge",
+        ecig_tax_structure=TAX_PER_CARTRIDGE,
         indoor_vaping_ban=True,
         indoor_ban_details="Comprehensive smoke-free law covering e-cigarettes",
         state_t21_law=True,
-        sources=["Tax Foundation 2025", "Truth Initiative 2025"]
+        sources=[SRC_TAX_FOUNDATION_2025, SRC_TRUTH_INITIATIVE_2025]
     ),
 
     StateTobaccoPolicy(
         state="New York",
         state_abbr="NY",
-        flavored_ecig_ban="comprehensive",
+        flavored_ecig_ban=BAN_COMPREHENSIVE,
         flavored_ecig_details="Comprehensive ban on flavored e-cigarettes (tobacco flavor only allowed). Does NOT ban menthol cigarettes.",
         flavored_ecig_effective_date="2020-05-18",
         menthol_cig_ban=False,
         has_ecig_tax=True,
         ecig_tax_rate="20% retail",
-        ecig_tax_structure="retail %",
+        ecig_tax_structure=TAX_RETAIL_PCT,
         indoor_vaping_ban=True,
         indoor_ban_details="Comprehensive smoke-free law covering e-cigarettes",
         state_t21_law=True,
-        sources=["Campaign for Tobacco-Free Kids 2024", "Tax Foundation 2025", "VapeRanger 2025"]
+        sources=[SRC_CTFK_2024, SRC_TAX_FOUNDATION_2025, SRC_VAPERANGER_2025]
     ),
 
     StateTobaccoPolicy(
         state="North Carolina",
         state_abbr="NC",
-        flavored_ecig_ban="partial",
+        flavored_ecig_ban=BAN_PARTIAL,
         flavored_ecig_details="As of July 1, 2025, only disposable vapes listed on state directory of FDA-authorized products can be sold",
         flavored_ecig_effective_date="2025-07-01",
         has_ecig_tax=True,
         ecig_tax_rate="12.8% wholesale (open), $0.05/mL (closed)",
-        ecig_tax_structure="hybrid",
+        ecig_tax_structure=TAX_HYBRID,
         indoor_vaping_ban=False,
         state_t21_law=True,
         recent_changes="New FDA-authorized product requirement as of July 2025",
-        sources=["Tax Foundation 2025", "VapeRanger 2025"]
+        sources=[SRC_TAX_FOUNDATION_2025, SRC_VAPERANGER_2025]
     ),
 
     StateTobaccoPolicy(
         state="North Dakota",
         state_abbr="ND",
-        flavored_ecig_ban="none",
+        flavored_ecig_ban=BAN_NONE,
         flavored_ecig_details="No statewide restrictions on flavored e-cigarettes",
         has_ecig_tax=False,
         indoor_vaping_ban=True,
         indoor_ban_details="Comprehensive smoke-free law covering e-cigarettes",
         state_t21_law=True,
-        sources=["Tax Foundation 2025", "Truth Initiative 2025"]
+        sources=[SRC_TAX_FOUNDATION_2025, SRC_TRUTH_INITIATIVE_2025]
     ),
 
     StateTobaccoPolicy(
         state="Ohio",
         state_abbr="OH",
-        flavored_ecig_ban="partial",
+        flavored_ecig_ban=BAN_PARTIAL,
         flavored_ecig_details="Statewide flavor ban enacted in 2025",
         flavored_ecig_effective_date="2025",
         has_ecig_tax=True,
         ecig_tax_rate="10% retail",
-        ecig_tax_structure="retail %",
+        ecig_tax_structure=TAX_RETAIL_PCT,
         indoor_vaping_ban=False,
         state_t21_law=True,
         recent_changes="State flavor ban enacted 2025. Court ruled state preemption of local tobacco laws unconstitutional (May 2024).",
         local_restrictions=["Columbus and 13 other municipalities have local flavor restrictions"],
-        sources=["Tax Foundation 2025", "VapeRanger 2025", "Campaign for Tobacco-Free Kids 2024"]
+        sources=[SRC_TAX_FOUNDATION_2025, SRC_VAPERANGER_2025, SRC_CTFK_2024]
     ),
 
     StateTobaccoPolicy(
         state="Oklahoma",
         state_abbr="OK",
-        flavored_ecig_ban="none",
+        flavored_ecig_ban=BAN_NONE,
         flavored_ecig_details="No statewide restrictions on flavored e-cigarettes",
         has_ecig_tax=False,
         indoor_vaping_ban=False,
         state_t21_law=True,
-        sources=["Tax Foundation 2025"]
+        sources=[SRC_TAX_FOUNDATION_2025]
     ),
 
     StateTobaccoPolicy(
         state="Oregon",
         state_abbr="OR",
-        flavored_ecig_ban="none",
+        flavored_ecig_ban=BAN_NONE,
         flavored_ecig_details="No statewide flavor ban, but many local restrictions",
         has_ecig_tax=True,
         ecig_tax_rate="65% wholesale",
-        ecig_tax_structure="wholesale %",
+        ecig_tax_structure=TAX_WHOLESALE_PCT,
         indoor_vaping_ban=True,
         indoor_ban_details="Comprehensive smoke-free law covering e-cigarettes",
         state_t21_law=True,
         recent_changes="Oregon Court of Appeals upheld Washington County's flavored tobacco law (May 2024)",
         local_restrictions=["Washington County and other localities have flavor restrictions"],
-        sources=["Tax Foundation 2025", "Campaign for Tobacco-Free Kids 2024", "Truth Initiative 2025"]
+        sources=[SRC_TAX_FOUNDATION_2025, SRC_CTFK_2024, SRC_TRUTH_INITIATIVE_2025]
     ),
 
     StateTobaccoPolicy(
         state="Pennsylvania",
         state_abbr="PA",
-        flavored_ecig_ban="none",
+        flavored_ecig_ban=BAN_NONE,
         flavored_ecig_details="No statewide restrictions on flavored e-cigarettes",
         has_ecig_tax=True,
         ecig_tax_rate="40% wholesale",
-        ecig_tax_structure="wholesale %",
+        ecig_tax_structure=TAX_WHOLESALE_PCT,
         indoor_vaping_ban=False,
         state_t21_law=True,
-        sources=["Tax Foundation 2025"]
+        sources=[SRC_TAX_FOUNDATION_2025]
     ),
 
     StateTobaccoPolicy(
         state="Rhode Island",
         state_abbr="RI",
-        flavored_ecig_ban="comprehensive",
+        flavored_ecig_ban=BAN_COMPREHENSIVE,
         flavored_ecig_details="Comprehensive ban on flavored e-cigarettes except tobacco and menthol, enforced Jan 1, 2025 (made permanent from 2019 executive order)",
         flavored_ecig_effective_date="2025-01-01",
         menthol_cig_ban=False,
         has_ecig_tax=True,
         ecig_tax_rate="10% wholesale (open), $0.50/mL (closed)",
-        ecig_tax_structure="hybrid",
+        ecig_tax_structure=TAX_HYBRID,
         indoor_vaping_ban=True,
         indoor_ban_details="Comprehensive smoke-free law covering e-cigarettes",
         state_t21_law=True,
         recent_changes="Flavor ban made permanent as of Jan 1, 2025. New e-cig tax enacted Jan 1, 2025.",
-        sources=["Tax Foundation 2025", "VapeRanger 2025", "Campaign for Tobacco-Free Kids 2024"]
+        sources=[SRC_TAX_FOUNDATION_2025, SRC_VAPERANGER_2025, SRC_CTFK_2024]
     ),
 
     StateTobaccoPolicy(
         state="South Carolina",
         state_abbr="SC",
-        flavored_ecig_ban="none",
+        flavored_ecig_ban=BAN_NONE,
         flavored_ecig_details="No statewide restrictions on flavored e-cigarettes",
         has_ecig_tax=False,
         indoor_vaping_ban=False,
         state_t21_law=False,
-        sources=["Tax Foundation 2025"]
+        sources=[SRC_TAX_FOUNDATION_2025]
     ),
 
     StateTobaccoPolicy(
         state="South Dakota",
         state_abbr="SD",
-        flavored_ecig_ban="none",
+        flavored_ecig_ban=BAN_NONE,
         flavored_ecig_details="No statewide restrictions on flavored e-cigarettes",
         has_ecig_tax=False,
         indoor_vaping_ban=False,
         state_t21_law=True,
-        sources=["Tax Foundation 2025"]
+        sources=[SRC_TAX_FOUNDATION_2025]
     ),
 
     StateTobaccoPolicy(
         state="Tennessee",
         state_abbr="TN",
-        flavored_ecig_ban="none",
+        flavored_ecig_ban=BAN_NONE,
         flavored_ecig_details="No statewide restrictions on flavored e-cigarettes",
         has_ecig_tax=False,
         indoor_vaping_ban=False,
         state_t21_law=True,
-        sources=["Tax Foundation 2025"]
+        sources=[SRC_TAX_FOUNDATION_2025]
     ),
 
     StateTobaccoPolicy(
         state="Texas",
         state_abbr="TX",
-        flavored_ecig_ban="partial",
+        flavored_ecig_ban=BAN_PARTIAL,
         flavored_ecig_details="State flavor ban enacted 2025. Additionally, SB 2024 prohibits sale of e-cigarette products made in China and pre-filled with liquid (effective June 2025)",
         flavored_ecig_effective_date="2025",
         has_ecig_tax=False,
         indoor_vaping_ban=False,
         state_t21_law=True,
         recent_changes="Flavor ban and China-made product ban enacted 2025",
-        sources=["Tax Foundation 2025", "VapeRanger 2025"]
+        sources=[SRC_TAX_FOUNDATION_2025, SRC_VAPERANGER_2025]
     ),
 
     StateTobaccoPolicy(
         state="Utah",
         state_abbr="UT",
-        flavored_ecig_ban="comprehensive",
+        flavored_ecig_ban=BAN_COMPREHENSIVE,
         flavored_ecig_details="Comprehensive ban on flavored vapes except tobacco and menthol (effective Jan 1, 2025, upheld by federal judge March 2025)",
         flavored_ecig_effective_date="2025-01-01",
         menthol_cig_ban=False,
         has_ecig_tax=True,
         ecig_tax_rate="56% manufacturer",
-        ecig_tax_structure="manufacturer %",
+        ecig_tax_structure=TAX_MANUFACTURER_PCT,
         indoor_vaping_ban=True,
         indoor_ban_details="Comprehensive smoke-free law covering e-cigarettes",
         state_t21_law=True,
         recent_changes="Flavor ban effective Jan 1, 2025, upheld by federal court March 2025",
-        sources=["Tax Foundation 2025", "VapeRanger 2025", "Campaign for Tobacco-Free Kids 2024"]
+        sources=[SRC_TAX_FOUNDATION_2025, SRC_VAPERANGER_2025, SRC_CTFK_2024]
     ),
 
     StateTobaccoPolicy(
         state="Vermont",
         state_abbr="VT",
-        flavored_ecig_ban="none",
+        flavored_ecig_ban=BAN_NONE,
         flavored_ecig_details="No statewide restrictions on flavored e-cigarettes",
         has_ecig_tax=True,
         ecig_tax_rate="92% wholesale",
-        ecig_tax_structure="wholesale %",
+        ecig_tax_structure=TAX_WHOLESALE_PCT,
         indoor_vaping_ban=True,
         indoor_ban_details="Comprehensive smoke-free law covering e-cigarettes",
         state_t21_law=True,
-        sources=["Tax Foundation 2025", "Truth Initiative 2025"]
+        sources=[SRC_TAX_FOUNDATION_2025, SRC_TRUTH_INITIATIVE_2025]
     ),
 
     StateTobaccoPolicy(
         state="Virginia",
         state_abbr="VA",
-        flavored_ecig_ban="none",
+        flavored_ecig_ban=BAN_NONE,
         flavored_ecig_details="No statewide restrictions on flavored e-cigarettes",
         has_ecig_tax=True,
         ecig_tax_rate="$0.11 per mL (increased from $0.066 in 2024)",
-        ecig_tax_structure="per mL",
+        ecig_tax_structure=TAX_PER_ML,
         indoor_vaping_ban=False,
         state_t21_law=True,
         recent_changes="E-cig tax increased to $0.11/mL in 2024",
-        sources=["Tax Foundation 2025"]
+        sources=[SRC_TAX_FOUNDATION_2025]
     ),
 
     StateTobaccoPolicy(
         state="Washington",
         state_abbr="WA",
-        flavored_ecig_ban="partial",
+        flavored_ecig_ban=BAN_PARTIAL,
         flavored_ecig_details="State flavor ban on e-cigarettes",
         has_ecig_tax=True,
         ecig_tax_rate="27% wholesale (open), $0.09/mL (closed)",
-        ecig_tax_structure="hybrid",
+        ecig_tax_structure=TAX_HYBRID,
         indoor_vaping_ban=True,
         indoor_ban_details="Comprehensive public vaping ban in indoor workplaces, restaurants, and bars",
         state_t21_law=True,
-        sources=["Tax Foundation 2025", "VapeRanger 2025"]
+        sources=[SRC_TAX_FOUNDATION_2025, SRC_VAPERANGER_2025]
     ),
 
     StateTobaccoPolicy(
         state="West Virginia",
         state_abbr="WV",
-        flavored_ecig_ban="none",
+        flavored_ecig_ban=BAN_NONE,
         flavored_ecig_details="No statewide restrictions on flavored e-cigarettes",
         has_ecig_tax=True,
         ecig_tax_rate="17.5% manufacturer (open), $0.075/mL (closed)",
-        ecig_tax_structure="hybrid",
+        ecig_tax_structure=TAX_HYBRID,
         indoor_vaping_ban=False,
         state_t21_law=True,
-        sources=["Tax Foundation 2025"]
+        sources=[SRC_TAX_FOUNDATION_2025]
     ),
 
     StateTobaccoPolicy(
         state="Wisconsin",
         state_abbr="WI",
-        flavored_ecig_ban="partial",
+        flavored_ecig_ban=BAN_PARTIAL,
         flavored_ecig_details="Similar law to North Carolina requiring FDA-authorized products, set for Sep 1, 2025 (may be subject to legal challenges)",
         flavored_ecig_effective_date="2025-09-01",
         has_ecig_tax=True,
         ecig_tax_rate="5¢ per mL",
-        ecig_tax_structure="per mL",
+        ecig_tax_structure=TAX_PER_ML,
         indoor_vaping_ban=False,
         state_t21_law=True,
         recent_changes="FDA-authorized product requirement scheduled for Sep 2025, facing legal challenges",
-        sources=["Tax Foundation 2025", "VapeRanger 2025"]
+        sources=[SRC_TAX_FOUNDATION_2025, SRC_VAPERANGER_2025]
     ),
 
     StateTobaccoPolicy(
         state="Wyoming",
         state_abbr="WY",
-        flavored_ecig_ban="none",
+        flavored_ecig_ban=BAN_NONE,
         flavored_ecig_details="No statewide restrictions on flavored e-cigarettes",
         has_ecig_tax=True,
         ecig_tax_rate="15% wholesale",
-        ecig_tax_structure="wholesale %",
+        ecig_tax_structure=TAX_WHOLESALE_PCT,
         indoor_vaping_ban=False,
         state_t21_law=True,
-        sources=["Tax Foundation 2025"]
+        sources=[SRC_TAX_FOUNDATION_2025]
     ),
 
     StateTobaccoPolicy(
         state="District of Columbia",
         state_abbr="DC",
-        flavored_ecig_ban="comprehensive",
+        flavored_ecig_ban=BAN_COMPREHENSIVE,
         flavored_ecig_details="Comprehensive flavor restrictions on e-cigarettes",
         has_ecig_tax=True,
         ecig_tax_rate="96% wholesale",
-        ecig_tax_structure="wholesale %",
+        ecig_tax_structure=TAX_WHOLESALE_PCT,
         indoor_vaping_ban=True,
         state_t21_law=True,
-        sources=["Tax Foundation 2025", "VapeRanger 2025"]
+        sources=[SRC_TAX_FOUNDATION_2025, SRC_VAPERANGER_2025]
     ),
 ]
 
 
-def export_to_json(filename: str = "state_policies.json"):
-    """Export all state data to JSON"""
+# Fields read by _compute_summary; only these get a column
+_SUMMARY_COLUMNS = (
+    "state",
+    "flavored_ecig_ban",
+    "menthol_cig_ban",
+    "has_ecig_tax",
+    "indoor_vaping_ban",
+)
+
+
+def _build_columns() -> Dict[str, tuple]:
+    """Build a column-oriented view of STATES, one tuple per summary field"""
+    # One pass over the rows, then transpose into columns
+    rows = map(attrgetter(*_SUMMARY_COLUMNS), STATES)
+    return dict(zip(_SUMMARY_COLUMNS, zip(*rows)))
+
+
+# Per-field columns for aggregate queries; STATES stays the row-oriented source
+_COLUMNS = MappingProxyType(_build_columns())
+
+
+def _compute_summary() -> Dict:
+    """Tally policy counts across all states"""
+    total_states = len(STATES)
+
+    # Each count scans only the column it needs; bools sum as 0/1
+    bans = _COLUMNS["flavored_ecig_ban"]
+    menthol = _COLUMNS["menthol_cig_ban"]
+    with_tax = sum(_COLUMNS["has_ecig_tax"])
+
+    return {
+        "total_states": total_states,
+        "comprehensive_ban": bans.count(BAN_COMPREHENSIVE),
+        "partial_ban": bans.count(BAN_PARTIAL),
+        "no_ban": bans.count(BAN_NONE),
+        "menthol_bans": sum(menthol),
+        "menthol_states": tuple(compress(_COLUMNS["state"], menthol)),
+        "with_tax": with_tax,
+        "without_tax": total_states - with_tax,
+        "indoor_bans": sum(_COLUMNS["indoor_vaping_ban"]),
+    }
+
+
+# Summary counts, computed once since STATES is fixed at import
+SUMMARY = MappingProxyType(_compute_summary())
+
+
+# Serialized export, built on first use; STATES never changes at runtime
+_CACHED_PAYLOAD: Optional[bytes] = None
+
+
+def _build_payload() -> bytes:
+    """Return the JSON export of all state data as UTF-8 bytes"""
+    global _CACHED_PAYLOAD
+    if _CACHED_PAYLOAD is not None:
+        return _CACHED_PAYLOAD
+
     data = {
         "metadata": {
             "last_updated": "2024-12-24",
@@ -769,29 +857,60 @@ def export_to_json(filename: str = "state_policies.json"):
             ],
             "notes": "Federal T21 law applies to all states. Data current as of December 2024/January 2025."
         },
-        "states": [state.to_dict() for state in STATES]
+        "states": STATES
     }
 
-    with open(filename, 'w') as f:
-        json.dump(data, f, indent=2)
+    # Encoders are imported here so importing the module stays cheap. Rows
+    # are converted one at a time as the encoder reaches them rather than
+    # materializing a list of dicts up front
+    try:
+        import orjson
+    except ImportError:  # optional; fall back to the stdlib encoder
+        import json
+        _CACHED_PAYLOAD = json.dumps(
+            data, indent=2, ensure_ascii=False, default=StateTobaccoPolicy.to_dict
+        ).encode("utf-8")
+    else:
+        _CACHED_PAYLOAD = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+
+    return _CACHED_PAYLOAD
+
+
+def export_to_json(filename: str = "state_policies.json", skip_unchanged: bool = False):
+    """Export all state data to JSON
+
+    With skip_unchanged, the write is skipped when the file already holds
+    exactly the current payload.
+    """
+    payload = _build_payload()
+
+    if skip_unchanged:
+        try:
+            with open(filename, 'rb') as f:
+                unchanged = f.read() == payload
+        except OSError:
+            unchanged = False
+        if unchanged:
+            print(f"{filename} is up to date, skipping export")
+            return
+
+    with open(filename, 'wb') as f:
+        f.write(payload)
 
     print(f"Exported {len(STATES)} state policies to {filename}")
 
 
 def generate_summary_stats():
     """Generate summary statistics"""
-    total_states = len(STATES)
-
-    comprehensive_ban = sum(1 for s in STATES if s.flavored_ecig_ban == "comprehensive")
-    partial_ban = sum(1 for s in STATES if s.flavored_ecig_ban == "partial")
-    no_ban = sum(1 for s in STATES if s.flavored_ecig_ban == "none")
-
-    menthol_bans = sum(1 for s in STATES if s.menthol_cig_ban)
-
-    with_tax = sum(1 for s in STATES if s.has_ecig_tax)
-    without_tax = total_states - with_tax
-
-    indoor_bans = sum(1 for s in STATES if s.indoor_vaping_ban)
+    total_states = SUMMARY["total_states"]
+    comprehensive_ban = SUMMARY["comprehensive_ban"]
+    partial_ban = SUMMARY["partial_ban"]
+    no_ban = SUMMARY["no_ban"]
+    menthol_bans = SUMMARY["menthol_bans"]
+    menthol_states = SUMMARY["menthol_states"]
+    with_tax = SUMMARY["with_tax"]
+    without_tax = SUMMARY["without_tax"]
+    indoor_bans = SUMMARY["indoor_bans"]
 
     print(f"\n{'='*60}")
     print("STATE VAPING & TOBACCO POLICY SUMMARY")
@@ -808,7 +927,7 @@ def generate_summary_stats():
 
     print("MENTHOL CIGARETTE BANS:")
     print(f"  States with menthol bans: {menthol_bans}")
-    print(f"  (Massachusetts, California)")
+    print(f"  ({', '.join(menthol_states)})")
     print()
 
     print("E-CIGARETTE EXCISE TAXES:")
@@ -823,6 +942,23 @@ def generate_summary_stats():
     print(f"{'='*60}\n")
 
 
+def main(argv: Optional[List[str]] = None):
+    """Command-line entry point: print the summary and export JSON"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="State vaping and tobacco policy database")
+    parser.add_argument("-o", "--output", default="state_policies.json",
+                        help="JSON file to export to (default: %(default)s)")
+    parser.add_argument("--force", action="store_true",
+                        help="rewrite the JSON export even if its content is unchanged")
+    parser.add_argument("--no-summary", action="store_true",
+                        help="skip printing the summary statistics")
+    args = parser.parse_args(argv)
+
+    if not args.no_summary:
+        generate_summary_stats()
+    export_to_json(args.output, skip_unchanged=not args.force)
+
+
 if __name__ == '__main__':
-    generate_summary_stats()
-    export_to_json()
+    main()